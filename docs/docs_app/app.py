@@ -3,7 +3,11 @@ from pathlib import Path
 
 from sanic import Sanic, response
 
-from docs_app.examples import get_normalized_example_name, load_examples
+from docs_app.examples import (
+    clear_example_files_cache,
+    get_normalized_example_name,
+    load_examples,
+)
 from reactpy import component
 from reactpy.backend.sanic import Options, configure, use_request
 from reactpy.core.types import ComponentConstructor
@@ -34,6 +38,7 @@ def _get_examples():
 
 
 def reload_examples():
+    clear_example_files_cache()
     _EXAMPLES.clear()
     _EXAMPLES.update(load_examples())
 
@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+import builtins
+import marshal
+import os
+import sys
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from hashlib import blake2b
 from io import StringIO
 from pathlib import Path
 from traceback import format_exc
-from typing import Callable
+from types import CodeType, ModuleType
+from typing import Any, Callable
 
 import reactpy
 from reactpy.types import ComponentType
 
 HERE = Path(__file__)
 SOURCE_DIR = HERE.parent.parent / "source"
+# marshalled example code persisted across docs builds - this is kept out of the build
+# dir since that is served publicly and watched for changes by the dev server
+COMPILED_CACHE_DIR = HERE.parent.parent / ".example_cache"
 CONF_FILE = SOURCE_DIR / "conf.py"
-RUN_ReactPy = reactpy.run
+
+# compiled example code keyed by (absolute path, modification time)
+_COMPILED_CACHE: dict[tuple[str, int], CodeType] = {}
 
 
 def load_examples() -> Iterator[tuple[str, Callable[[], ComponentType]]]:
@@ -21,10 +33,16 @@ def load_examples() -> Iterator[tuple[str, Callable[[], ComponentType]]]:
 
 
 def all_example_names() -> set[str]:
+    # plain string slicing here avoids creating several Path objects per example
+    prefix_len = len(str(SOURCE_DIR)) + len(os.sep)
+    main_suffix = f"{os.sep}main.py"
     names = set()
-    for file in _iter_example_files(SOURCE_DIR):
-        path = file.parent if file.name == "main.py" else file
-        names.add("/".join(path.relative_to(SOURCE_DIR).with_suffix("").parts))
+    for file in map(str, _list_example_files()):
+        if file.endswith(main_suffix):
+            name = file[prefix_len : -len(main_suffix)]
+        else:
+            name = file[prefix_len:-3]  # strip '.py'
+        names.add(name.replace(os.sep, "/"))
     return names
 
 
@@ -64,13 +82,27 @@ def get_example_files_by_name(
         return [path] if path.exists() else []
 
 
+def clear_example_files_cache() -> None:
+    """Forget the result of the last example directory scan"""
+    _list_example_files.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _list_example_files() -> tuple[Path, ...]:
+    return tuple(_iter_example_files(SOURCE_DIR))
+
+
 def _iter_example_files(root: Path) -> Iterator[Path]:
-    for path in root.iterdir():
-        if path.is_dir():
-            if not path.name.startswith("_") or path.name == "_examples":
-                yield from _iter_example_files(path)
-        elif path.suffix == ".py" and path != CONF_FILE:
-            yield path
+    conf_file = str(CONF_FILE)
+    to_visit = [str(root)]
+    while to_visit:
+        with os.scandir(to_visit.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.name.startswith("_") or entry.name == "_examples":
+                        to_visit.append(entry.path)
+                elif entry.name.endswith(".py") and entry.path != conf_file:
+                    yield Path(entry.path)
 
 
 def _load_one_example(file_or_name: Path | str) -> ComponentType:
@@ -79,9 +111,6 @@ def _load_one_example(file_or_name: Path | str) -> ComponentType:
     else:
         file = file_or_name
 
-    if not file.exists():
-        raise FileNotFoundError(str(file))
-
     print_buffer = _PrintBuffer()
 
     def capture_print(*args, **kwargs):
@@ -95,21 +124,26 @@ def _load_one_example(file_or_name: Path | str) -> ComponentType:
         nonlocal captured_component_constructor
         captured_component_constructor = component_constructor
 
-    reactpy.run = capture_component
     try:
-        code = compile(file.read_text(), str(file), "exec")
+        # no separate exists() check - compiling stats the file anyway
+        code = _compile_example(file)
+    except FileNotFoundError:
+        raise FileNotFoundError(str(file)) from None
+    except Exception:
+        return _make_error_display(format_exc())
+
+    try:
         exec(
             code,
             {
                 "print": capture_print,
                 "__file__": str(file),
                 "__name__": file.stem,
+                "__builtins__": _make_example_builtins(capture_component),
             },
         )
     except Exception:
         return _make_error_display(format_exc())
-    finally:
-        reactpy.run = RUN_ReactPy
 
     if captured_component_constructor is None:
         return _make_example_did_not_run(str(file))
@@ -131,6 +165,66 @@ def _load_one_example(file_or_name: Path | str) -> ComponentType:
     return Wrapper()
 
 
+def _compile_example(file: Path) -> CodeType:
+    key = (str(file.absolute()), file.stat().st_mtime_ns)
+    try:
+        return _COMPILED_CACHE[key]
+    except KeyError:
+        code = _COMPILED_CACHE[key] = _load_or_compile_example(file)
+        return code
+
+
+def _load_or_compile_example(file: Path) -> CodeType:
+    source = file.read_bytes()
+    # entries are prefixed by a digest of the path so stale ones can be found later
+    path_digest = blake2b(str(file.absolute()).encode(), digest_size=16).hexdigest()
+    source_digest = blake2b(source, digest_size=16).hexdigest()
+    cache_tag = sys.implementation.cache_tag
+    cache_file = COMPILED_CACHE_DIR / f"{path_digest}-{source_digest}.{cache_tag}"
+    try:
+        return marshal.loads(cache_file.read_bytes())  # noqa: S302
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    code = compile(source, str(file), "exec")
+    try:
+        COMPILED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale_file in COMPILED_CACHE_DIR.glob(f"{path_digest}-*"):
+            stale_file.unlink()
+        cache_file.write_bytes(marshal.dumps(code))
+    except OSError:  # nocov
+        pass  # the cache is only an optimization
+    return code
+
+
+def _make_example_builtins(
+    capture_component: Callable[[Callable[[], ComponentType]], None],
+) -> dict[str, Any]:
+    # examples see their own 'reactpy' module whose 'run' function captures the
+    # component instead of us swapping out the global 'reactpy.run'
+    example_reactpy = _ExampleReactPyModule(capture_component)
+
+    def example_import(
+        name: str,
+        globals: dict[str, Any] | None = None,
+        locals: dict[str, Any] | None = None,
+        fromlist: Sequence[str] = (),
+        level: int = 0,
+    ) -> ModuleType:
+        module = builtins.__import__(name, globals, locals, fromlist, level)
+        return example_reactpy if module is reactpy else module
+
+    return {**builtins.__dict__, "__import__": example_import}
+
+
+class _ExampleReactPyModule(ModuleType):
+    def __init__(self, run: Callable[[Callable[[], ComponentType]], None]) -> None:
+        super().__init__(reactpy.__name__, reactpy.__doc__)
+        self.run = run
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(reactpy, name)
+
+
 def _get_root_example_path_by_name(name: str, relative_to: str | Path | None) -> Path:
     if not name.startswith("/") and relative_to is not None:
         rel_path = Path(relative_to)
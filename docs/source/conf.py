@@ -5,6 +5,7 @@
 # full list see the documentation:
 # http://www.sphinx-doc.org/en/master/config
 
+import os
 import sys
 from doctest import DONT_ACCEPT_TRUE_FOR_1, ELLIPSIS, NORMALIZE_WHITESPACE
 from pathlib import Path
@@ -214,10 +215,11 @@ html_static_path = ["_static"]
 
 # These paths are either relative to html_static_path
 # or fully qualified paths (eg. https://...)
+# (sorted so the config value is stable between builds and doesn't force a full rebuild)
 css_dir = THIS_DIR / "_static" / "css"
-html_css_files = [
-    str(p.relative_to(THIS_DIR / "_static")) for p in css_dir.glob("*.css")
-]
+html_css_files = sorted(
+    f"css/{entry.name}" for entry in os.scandir(css_dir) if entry.name.endswith(".css")
+)
 
 # Custom sidebar templates, must be a dictionary that maps document names
 # to template names.
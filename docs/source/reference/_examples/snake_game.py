@@ -1,7 +1,9 @@
 import asyncio
 import enum
+import functools
 import random
 import time
+from collections import deque
 
 import reactpy
 
@@ -17,16 +19,16 @@ class GameState(enum.Enum):
 def GameView():
     game_state, set_game_state = reactpy.hooks.use_state(GameState.init)
 
-    if game_state == GameState.play:
+    if game_state is GameState.play:
         return GameLoop(grid_size=6, block_scale=50, set_game_state=set_game_state)
 
     start_button = reactpy.html.button(
         {"on_click": lambda event: set_game_state(GameState.play)}, "Start"
     )
 
-    if game_state == GameState.won:
+    if game_state is GameState.won:
         menu = reactpy.html.div(reactpy.html.h3("You won!"), start_button)
-    elif game_state == GameState.lost:
+    elif game_state is GameState.lost:
         menu = reactpy.html.div(reactpy.html.h3("You lost"), start_button)
     else:
         menu = reactpy.html.div(reactpy.html.h3("Click to play"), start_button)
@@ -57,37 +59,39 @@ def GameLoop(grid_size, block_scale, set_game_state):
     last_direction = direction.current
 
     snake, set_snake = reactpy.hooks.use_state(
-        [(grid_size // 2 - 1, grid_size // 2 - 1)]
+        lambda: deque([(grid_size // 2 - 1, grid_size // 2 - 1)])
     )
     food, set_food = use_snake_food(grid_size, snake)
 
-    grid = create_grid(grid_size, block_scale)
-
     @reactpy.event(prevent_default=True)
     def on_direction_change(event):
         if hasattr(Direction, event["key"]):
             maybe_new_direction = Direction[event["key"]].value
-            direction_vector_sum = tuple(
-                map(sum, zip(last_direction, maybe_new_direction))
+            direction_vector_sum = (
+                last_direction[0] + maybe_new_direction[0],
+                last_direction[1] + maybe_new_direction[1],
             )
             if direction_vector_sum != (0, 0):
                 direction.current = maybe_new_direction
 
-    grid_wrapper = reactpy.html.div({"on_key_down": on_direction_change}, grid)
-
-    assign_grid_block_color(grid, food, "blue")
-
-    for location in snake:
-        assign_grid_block_color(grid, location, "white")
-
     new_game_state = None
-    if snake[-1] in snake[:-1]:
-        assign_grid_block_color(grid, snake[-1], "red")
+    head_color = "white"
+    # the snake has run into itself if any of its points overlap
+    if len(set(snake)) != len(snake):
+        head_color = "red"
         new_game_state = GameState.lost
     elif len(snake) == grid_size**2:
-        assign_grid_block_color(grid, snake[-1], "yellow")
+        head_color = "yellow"
         new_game_state = GameState.won
 
+    # the colors of all the blocks which aren't black keyed by their grid point
+    block_colors = {food: "blue"}
+    block_colors.update(dict.fromkeys(snake, "white"))
+    block_colors[snake[-1]] = head_color
+
+    grid = create_grid(grid_size, block_scale, block_colors)
+    grid_wrapper = reactpy.html.div({"on_key_down": on_direction_change}, grid)
+
     interval = use_interval(0.5)
 
     @reactpy.hooks.use_effect
@@ -105,11 +109,13 @@ def GameLoop(grid_size, block_scale, set_game_state):
             (snake[-1][1] + direction.current[1]) % grid_size,
         )
 
+        # a deque lets us drop the tail without shifting every other point
+        new_snake = snake.copy()
         if snake[-1] == food:
             set_food()
-            new_snake = [*snake, new_snake_head]
         else:
-            new_snake = snake[1:] + [new_snake_head]
+            new_snake.popleft()
+        new_snake.append(new_snake_head)
 
         set_snake(new_snake)
 
@@ -117,72 +123,81 @@ def GameLoop(grid_size, block_scale, set_game_state):
 
 
 def use_snake_food(grid_size, current_snake):
-    grid_points = {(x, y) for x in range(grid_size) for y in range(grid_size)}
-    points_not_in_snake = grid_points.difference(current_snake)
-
     food, _set_food = reactpy.hooks.use_state(current_snake[-1])
 
     def set_food():
-        _set_food(random.choice(list(points_not_in_snake)))
+        # pick random points until one is free - cheap unless the board is nearly full
+        snake_points = set(current_snake)
+        while True:
+            point = (random.randrange(grid_size), random.randrange(grid_size))
+            if point not in snake_points:
+                break
+        _set_food(point)
 
     return food, set_food
 
 
 def use_interval(rate):
-    usage_time = reactpy.hooks.use_ref(time.time())
+    # a monotonic clock can't jump backwards (e.g. due to NTP) like wall-clock time
+    usage_time = reactpy.hooks.use_ref(time.monotonic_ns())
 
     async def interval() -> None:
-        await asyncio.sleep(rate - (time.time() - usage_time.current))
-        usage_time.current = time.time()
+        elapsed = (time.monotonic_ns() - usage_time.current) / 1e9
+        await asyncio.sleep(max(0.0, rate - elapsed))
+        usage_time.current = time.monotonic_ns()
 
     return asyncio.ensure_future(interval())
 
 
-def create_grid(grid_size, block_scale):
+def create_grid(grid_size, block_scale, block_colors):
     return reactpy.html.div(
-        {
-            "style": {
-                "height": f"{block_scale * grid_size}px",
-                "width": f"{block_scale * grid_size}px",
-                "cursor": "pointer",
-                "display": "grid",
-                "grid-gap": 0,
-                "grid-template-columns": f"repeat({grid_size}, {block_scale}px)",
-                "grid-template-rows": f"repeat({grid_size}, {block_scale}px)",
-            },
-            "tab_index": -1,
-        },
+        {"style": grid_style(grid_size, block_scale), "tab_index": -1},
         [
             reactpy.html.div(
-                {"style": {"height": f"{block_scale}px"}, "key": i},
+                {"style": grid_row_style(block_scale), "key": x},
                 [
-                    create_grid_block("black", block_scale, key=i)
-                    for i in range(grid_size)
+                    create_grid_block(
+                        block_colors.get((x, y), "black"), block_scale, key=y
+                    )
+                    for y in range(grid_size)
                 ],
             )
-            for i in range(grid_size)
+            for x in range(grid_size)
         ],
     )
 
 
-def create_grid_block(color, block_scale, key):
-    return reactpy.html.div(
-        {
-            "style": {
-                "height": f"{block_scale}px",
-                "width": f"{block_scale}px",
-                "background_color": color,
-                "outline": "1px solid grey",
-            },
-            "key": key,
-        }
-    )
+@functools.lru_cache(maxsize=32)
+def grid_style(grid_size, block_scale):
+    return {
+        "height": f"{block_scale * grid_size}px",
+        "width": f"{block_scale * grid_size}px",
+        "cursor": "pointer",
+        "display": "grid",
+        "grid-gap": 0,
+        "grid-template-columns": f"repeat({grid_size}, {block_scale}px)",
+        "grid-template-rows": f"repeat({grid_size}, {block_scale}px)",
+    }
+
 
+@functools.lru_cache(maxsize=32)
+def grid_row_style(block_scale):
+    return {"height": f"{block_scale}px"}
 
-def assign_grid_block_color(grid, point, color):
-    x, y = point
-    block = grid["children"][x]["children"][y]
-    block["attributes"]["style"]["backgroundColor"] = color
+
+def create_grid_block(color, block_scale, key):
+    return reactpy.html.div({"style": grid_block_style(color, block_scale), "key": key})
+
+
+# blocks only differ by color so their styles are shared rather than rebuilt
+@functools.cache
+def grid_block_style(color, block_scale):
+    return {
+        "height": f"{block_scale}px",
+        "width": f"{block_scale}px",
+        "background_color": color,
+        "outline": "1px solid grey",
+    }
 
 
 reactpy.run(GameView)
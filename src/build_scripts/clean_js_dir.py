@@ -4,12 +4,15 @@
 # ///
 
 # Deletes `dist`, `node_modules`, and `tsconfig.tsbuildinfo` from all JS packages in the JS source directory.
+# Pass `--keep-node-modules` to leave installed dependencies in place so the next `bun install` only has to
+# reconcile them against each package's lockfile instead of reinstalling everything.
 
 import contextlib
 import glob
 import os
 import pathlib
 import shutil
+import sys
 
 # Get the path to the JS source directory
 js_src_dir = pathlib.Path(__file__).parent.parent / "js"
@@ -18,7 +21,10 @@ js_src_dir = pathlib.Path(__file__).parent.parent / "js"
 dist_dirs = glob.glob(str(js_src_dir / "**/dist"), recursive=True)
 
 # Get the paths to all `node_modules` folders in the JS source directory
-node_modules_dirs = glob.glob(str(js_src_dir / "**/node_modules"), recursive=True)
+if "--keep-node-modules" in sys.argv:
+    node_modules_dirs = []
+else:
+    node_modules_dirs = glob.glob(str(js_src_dir / "**/node_modules"), recursive=True)
 
 # Get the paths to all `tsconfig.tsbuildinfo` files in the JS source directory
 tsconfig_tsbuildinfo_files = glob.glob(
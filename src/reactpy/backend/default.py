@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import cache
 from logging import getLogger
 from sys import exc_info
 from typing import Any, NoReturn
@@ -10,7 +11,6 @@ from reactpy.backend.utils import SUPPORTED_BACKENDS, all_implementations
 from reactpy.types import RootComponentConstructor
 
 logger = getLogger(__name__)
-_DEFAULT_IMPLEMENTATION: BackendType[Any] | None = None
 
 
 # BackendType.Options
@@ -54,13 +54,9 @@ async def serve_development_app(
     )
 
 
+@cache
 def _default_implementation() -> BackendType[Any]:
     """Get the first available server implementation"""
-    global _DEFAULT_IMPLEMENTATION  # noqa: PLW0603
-
-    if _DEFAULT_IMPLEMENTATION is not None:
-        return _DEFAULT_IMPLEMENTATION
-
     try:
         implementation = next(all_implementations())
     except StopIteration:  # nocov
@@ -74,5 +70,4 @@ def _default_implementation() -> BackendType[Any]:
         )
         raise RuntimeError(msg) from None
     else:
-        _DEFAULT_IMPLEMENTATION = implementation
         return implementation
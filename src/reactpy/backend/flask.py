@@ -36,6 +36,7 @@ from reactpy.backend._common import (
     safe_web_modules_dir_path,
 )
 from reactpy.backend.types import Connection, Location
+from reactpy.backend.utils import new_event_loop
 from reactpy.core.hooks import ConnectionContext
 from reactpy.core.hooks import use_connection as _use_connection
 from reactpy.core.serve import serve_layout
@@ -216,7 +217,7 @@ def _dispatch_in_thread(
 
     @copy_current_request_context
     def run_dispatcher() -> None:
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
 
         thread_send_queue: ThreadQueue[Any] = ThreadQueue()
@@ -4,10 +4,10 @@ import asyncio
 import logging
 import socket
 import sys
-from collections.abc import Iterator
+from collections.abc import Coroutine, Iterator
 from contextlib import closing
 from importlib import import_module
-from typing import Any
+from typing import Any, cast
 
 from reactpy.backend.types import BackendType
 from reactpy.types import RootComponentConstructor
@@ -29,7 +29,11 @@ def run(
     port: int | None = None,
     implementation: BackendType[Any] | None = None,
 ) -> None:
-    """Run a component with a development server"""
+    """Run a component with a development server
+
+    The server runs on `uvloop <https://github.com/MagicStack/uvloop>`__ if it's
+    installed (it comes with ``uvicorn[standard]``).
+    """
     logger.warning(_DEVELOPMENT_RUN_FUNC_WARNING)
 
     implementation = implementation or import_module("reactpy.backend.default")
@@ -45,26 +49,58 @@ def run(
         host,
         port,
     )
-    asyncio.run(implementation.serve_development_app(app, host, port))
+    _run_coroutine(implementation.serve_development_app(app, host, port))
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop - this is a uvloop event loop if it's installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    else:
+        # uvloop is untyped so this would otherwise be Any
+        return cast(asyncio.AbstractEventLoop, uvloop.new_event_loop())
+
+
+def _run_coroutine(main: Coroutine[Any, Any, None]) -> None:
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return None
+
+    if hasattr(uvloop, "run"):
+        uvloop.run(main)
+        return None
+
+    # uvloop<0.18 has no run() function - uvicorn[standard] still allows those versions
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    try:
+        loop.run_until_complete(main)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
 
 
 def find_available_port(host: str, port_min: int = 8000, port_max: int = 9000) -> int:
     """Get a port that's available for the given host and port range"""
-    for port in range(port_min, port_max):
-        with closing(socket.socket()) as sock:
+    # a failed bind leaves the socket unbound so one socket can probe every port
+    with closing(socket.socket()) as sock:
+        if sys.platform in ("linux", "darwin"):
+            # Fixes bug on Unix-like systems where every time you restart the
+            # server you'll get a different port on Linux. This cannot be set
+            # on Windows otherwise address will always be reused.
+            # Ref: https://stackoverflow.com/a/19247688/3159288
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        for port in range(port_min, port_max):
             try:
-                if sys.platform in ("linux", "darwin"):
-                    # Fixes bug on Unix-like systems where every time you restart the
-                    # server you'll get a different port on Linux. This cannot be set
-                    # on Windows otherwise address will always be reused.
-                    # Ref: https://stackoverflow.com/a/19247688/3159288
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 sock.bind((host, port))
             except OSError:
                 pass
             else:
                 return port
-    msg = f"Host {host!r} has no available port in range {port_max}-{port_max}"
+    msg = f"Host {host!r} has no available port in range {port_min}-{port_max}"
     raise RuntimeError(msg)
 
 
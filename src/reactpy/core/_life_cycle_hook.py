@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import logging
 from asyncio import Event, Task, create_task, gather
+from contextvars import ContextVar, Token, copy_context
 from typing import Any, Callable, Protocol, TypeVar
 
 from anyio import Semaphore
 
-from reactpy.core._thread_local import ThreadLocal
 from reactpy.core.types import ComponentType, Context, ContextProviderType
 
 T = TypeVar("T")
@@ -18,16 +18,18 @@ class EffectFunc(Protocol):
 
 logger = logging.getLogger(__name__)
 
-_HOOK_STATE: ThreadLocal[list[LifeCycleHook]] = ThreadLocal(list)
+_CURRENT_HOOK: ContextVar[LifeCycleHook | None] = ContextVar(
+    "reactpy_current_hook", default=None
+)
 
 
 def current_hook() -> LifeCycleHook:
     """Get the current :class:`LifeCycleHook`"""
-    hook_stack = _HOOK_STATE.get()
-    if not hook_stack:
+    hook = _CURRENT_HOOK.get()
+    if hook is None:
         msg = "No life cycle hook is active. Are you rendering in a layout?"
         raise RuntimeError(msg)
-    return hook_stack[-1]
+    return hook
 
 
 class LifeCycleHook:
@@ -116,6 +118,7 @@ class LifeCycleHook:
         "_schedule_render_callback",
         "_scheduled_render",
         "_state",
+        "_token",
         "component",
     )
 
@@ -130,7 +133,7 @@ class LifeCycleHook:
         self._scheduled_render = False
         self._rendered_atleast_once = False
         self._current_state_index = 0
-        self._state: tuple[Any, ...] = ()
+        self._state: list[Any] = []
         self._effect_funcs: list[EffectFunc] = []
         self._effect_tasks: list[Task[None]] = []
         self._effect_stops: list[Event] = []
@@ -140,7 +143,15 @@ class LifeCycleHook:
         if self._scheduled_render:
             return None
         try:
-            self._schedule_render_callback()
+            if _CURRENT_HOOK.get() is None:
+                self._schedule_render_callback()
+            else:
+                # Renders may be scheduled from within another component's render.
+                # Tasks copy the context they're created in so we need to make sure
+                # the hook being rendered right now does not leak into that task.
+                context = copy_context()
+                context.run(_CURRENT_HOOK.set, None)
+                context.run(self._schedule_render_callback)
         except Exception:
             msg = f"Failed to schedule render via {self._schedule_render_callback}"
             logger.exception(msg)
@@ -150,14 +161,14 @@ class LifeCycleHook:
     def use_state(self, function: Callable[[], T]) -> T:
         """Add state to this hook
 
-        If this hook has not yet rendered, the state is appended to the state tuple.
-        Otherwise, the state is retrieved from the tuple. This allows state to be
+        If this hook has not yet rendered, the state is appended to the state list.
+        Otherwise, the state is retrieved from the list. This allows state to be
         preserved across renders.
         """
         if not self._rendered_atleast_once:
             # since we're not initialized yet we're just appending state
             result = function()
-            self._state += (result,)
+            self._state.append(result)
         else:
             # once finalized we iterate over each succesively used piece of state
             result = self._state[self._current_state_index]
@@ -209,6 +220,8 @@ class LifeCycleHook:
 
     async def affect_layout_did_render(self) -> None:
         """The layout completed a render"""
+        if not self._effect_funcs:
+            return None
         stop = Event()
         self._effect_stops.append(stop)
         self._effect_tasks.extend(create_task(e(stop)) for e in self._effect_funcs)
@@ -219,6 +232,8 @@ class LifeCycleHook:
         for stop in self._effect_stops:
             stop.set()
         self._effect_stops.clear()
+        if not self._effect_tasks:
+            return None
         try:
             await gather(*self._effect_tasks)
         except Exception:
@@ -227,18 +242,19 @@ class LifeCycleHook:
             self._effect_tasks.clear()
 
     def set_current(self) -> None:
-        """Set this hook as the active hook in this thread
+        """Set this hook as the active hook in this context
 
         This method is called by a layout before entering the render method
         of this hook's associated component.
         """
-        hook_stack = _HOOK_STATE.get()
-        if hook_stack:
-            parent = hook_stack[-1]
+        parent = _CURRENT_HOOK.get()
+        if parent is not None:
             self._context_providers.update(parent._context_providers)
-        hook_stack.append(self)
+        self._token: Token[LifeCycleHook | None] = _CURRENT_HOOK.set(self)
 
     def unset_current(self) -> None:
-        """Unset this hook as the active hook in this thread"""
-        if _HOOK_STATE.get().pop() is not self:
+        """Unset this hook as the active hook in this context"""
+        if _CURRENT_HOOK.get() is not self:
             raise RuntimeError("Hook stack is in an invalid state")  # nocov
+        _CURRENT_HOOK.reset(self._token)
+        del self._token
@@ -140,36 +140,40 @@ def use_effect(
     last_clean_callback: Ref[_EffectCleanFunc | None] = use_ref(None)
 
     def add_effect(function: _EffectApplyFunc) -> None:
-        if not asyncio.iscoroutinefunction(function):
-            sync_function = cast(_SyncEffectFunc, function)
-        else:
-            async_function = cast(_AsyncEffectFunc, function)
-
-            def sync_function() -> _EffectCleanFunc | None:
-                task = asyncio.create_task(async_function())
-
-                def clean_future() -> None:
-                    if not task.cancel():
-                        try:
-                            clean = task.result()
-                        except asyncio.CancelledError:
-                            pass
-                        else:
-                            if clean is not None:
-                                clean()
-
-                return clean_future
-
-        async def effect(stop: asyncio.Event) -> None:
-            if last_clean_callback.current is not None:
-                last_clean_callback.current()
-                last_clean_callback.current = None
-            clean = last_clean_callback.current = sync_function()
-            await stop.wait()
-            if clean is not None:
-                clean()
-
-        return memoize(lambda: hook.add_effect(effect))
+        # only build the effect when it will actually be added (i.e. deps changed)
+        def register_effect() -> None:
+            if not asyncio.iscoroutinefunction(function):
+                sync_function = cast(_SyncEffectFunc, function)
+            else:
+                async_function = cast(_AsyncEffectFunc, function)
+
+                def sync_function() -> _EffectCleanFunc | None:
+                    task = asyncio.create_task(async_function())
+
+                    def clean_future() -> None:
+                        if not task.cancel():
+                            try:
+                                clean = task.result()
+                            except asyncio.CancelledError:
+                                pass
+                            else:
+                                if clean is not None:
+                                    clean()
+
+                    return clean_future
+
+            async def effect(stop: asyncio.Event) -> None:
+                if last_clean_callback.current is not None:
+                    last_clean_callback.current()
+                    last_clean_callback.current = None
+                clean = last_clean_callback.current = sync_function()
+                await stop.wait()
+                if clean is not None:
+                    clean()
+
+            hook.add_effect(effect)
+
+        return memoize(register_effect)
 
     if function is not None:
         add_effect(function)
@@ -436,23 +440,13 @@ def use_memo(
     else:
         changed = False
 
-    setup: Callable[[Callable[[], _Type]], _Type]
-
-    if changed:
-
-        def setup(function: Callable[[], _Type]) -> _Type:
-            current_value = memo.value = function()
-            return current_value
-
-    else:
-
-        def setup(function: Callable[[], _Type]) -> _Type:
-            return memo.value
-
     if function is not None:
-        return setup(function)
+        # avoid creating a closure in the common case of a direct call
+        return memo.update(function) if changed else memo.value
+    elif changed:
+        return memo.update
     else:
-        return setup
+        return memo.get
 
 
 class _Memo(Generic[_Type]):
@@ -471,6 +465,13 @@ class _Memo(Generic[_Type]):
         else:
             return False
 
+    def update(self, function: Callable[[], _Type]) -> _Type:
+        current_value = self.value = function()
+        return current_value
+
+    def get(self, function: Callable[[], _Type]) -> _Type:
+        return self.value
+
 
 def use_ref(initial_value: _Type) -> Ref[_Type]:
     """See the full :ref:`Use State` docs for details
@@ -518,6 +519,10 @@ def strictly_equal(x: Any, y: Any) -> bool:
     - ``bytearray``
     - ``memoryview``
     """
+    # Identical objects are always equal - this is by far the most common case
+    if x is y:
+        return True
+
     # Return early if the objects are not the same type
     if type(x) is not type(y):
         return False
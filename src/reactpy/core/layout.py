@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import abc
 from asyncio import (
-    FIRST_COMPLETED,
     CancelledError,
     Queue,
     Task,
     create_task,
+    gather,
     get_running_loop,
-    wait,
 )
 from collections import Counter
 from collections.abc import Sequence
 from contextlib import AsyncExitStack
 from logging import getLogger
+from random import Random
 from typing import (
     Any,
     Callable,
@@ -23,10 +23,8 @@ from typing import (
     TypeVar,
     cast,
 )
-from uuid import uuid4
 from weakref import ref as weakref
 
-from anyio import Semaphore
 from typing_extensions import TypeAlias
 
 from reactpy.config import (
@@ -35,6 +33,7 @@ from reactpy.config import (
     REACTPY_DEBUG_MODE,
 )
 from reactpy.core._life_cycle_hook import LifeCycleHook
+from reactpy.core.component import Component
 from reactpy.core.types import (
     ComponentType,
     EventHandlerDict,
@@ -42,7 +41,6 @@ from reactpy.core.types import (
     LayoutEventMessage,
     LayoutUpdateMessage,
     VdomChild,
-    VdomDict,
     VdomJson,
 )
 from reactpy.core.vdom import validate_vdom_json
@@ -59,7 +57,7 @@ class Layout:
         "_event_handlers",
         "_rendering_queue",
         "_render_tasks",
-        "_render_tasks_ready",
+        "_finished_render_tasks",
         "_root_life_cycle_state_id",
         "_model_states_by_life_cycle_state_id",
     )
@@ -77,8 +75,8 @@ class Layout:
     async def __aenter__(self) -> Layout:
         # create attributes here to avoid access before entering context manager
         self._event_handlers: EventHandlerDict = {}
-        self._render_tasks: set[Task[LayoutUpdateMessage]] = set()
-        self._render_tasks_ready: Semaphore = Semaphore(0)
+        self._render_tasks: set[Task[LayoutUpdateMessage | None]] = set()
+        self._finished_render_tasks: Queue[Task[LayoutUpdateMessage | None]] = Queue()
 
         self._rendering_queue: _ThreadSafeQueue[_LifeCycleStateId] = _ThreadSafeQueue()
         root_model_state = _new_root_model_state(self.root, self._schedule_render_task)
@@ -93,7 +91,8 @@ class Layout:
         root_csid = self._root_life_cycle_state_id
         root_model_state = self._model_states_by_life_cycle_state_id[root_csid]
 
-        for t in self._render_tasks:
+        # copied since finished tasks remove themselves from the set
+        for t in list(self._render_tasks):
             t.cancel()
             try:
                 await t
@@ -149,13 +148,11 @@ class Layout:
 
     async def _parallel_render(self) -> LayoutUpdateMessage:
         """Await to fetch the first completed render within our asyncio task group.
-        We use the `asyncio.tasks.wait` API in order to return the first completed task.
+        Render tasks push themselves onto a queue when done so we never need to wait
+        on the whole group at once.
         """
-        await self._render_tasks_ready.acquire()
-        done, _ = await wait(self._render_tasks, return_when=FIRST_COMPLETED)
-        update_task: Task[LayoutUpdateMessage] = done.pop()
-        self._render_tasks.remove(update_task)
-        return update_task.result()
+        update_task = await self._finished_render_tasks.get()
+        return cast(LayoutUpdateMessage, update_task.result())
 
     async def _create_layout_update(
         self, old_state: _ModelState
@@ -193,9 +190,16 @@ class Layout:
             raw_model = component.render()
             # wrap the model in a fragment (i.e. tagName="") to ensure components have
             # a separate node in the model state tree. This could be removed if this
-            # components are given a node in the tree some other way
-            wrapper_model: VdomDict = {"tagName": "", "children": [raw_model]}
-            await self._render_model(exit_stack, old_state, new_state, wrapper_model)
+            # components are given a node in the tree some other way. The fragment has
+            # nothing but children so we build it directly instead of rendering a
+            # wrapper VDOM dict through _render_model.
+            new_state.model.current = {"tagName": ""}
+            if old_state is not None and old_state.targets_by_event:
+                # the old state may be from an element that had event handlers
+                self._render_model_event_handlers(old_state, new_state, {})
+            await self._render_model_children(
+                exit_stack, old_state, new_state, [raw_model]
+            )
         except Exception as error:
             logger.exception(f"Failed to render {component}")
             new_state.model.current = {
@@ -235,54 +239,62 @@ class Layout:
         new_state: _ModelState,
         raw_model: Any,
     ) -> None:
+        # build the whole model in one pass before handing it to the model state
         try:
-            new_state.model.current = {"tagName": raw_model["tagName"]}
+            model: VdomJson = {"tagName": raw_model["tagName"]}
         except Exception as e:  # nocov
             msg = f"Expected a VDOM element dict, not {raw_model}"
             raise ValueError(msg) from e
         if "key" in raw_model:
-            new_state.key = new_state.model.current["key"] = raw_model["key"]
+            new_state.key = model["key"] = raw_model["key"]
         if "importSource" in raw_model:
-            new_state.model.current["importSource"] = raw_model["importSource"]
-        self._render_model_attributes(old_state, new_state, raw_model)
-        await self._render_model_children(
-            exit_stack, old_state, new_state, raw_model.get("children", [])
-        )
+            model["importSource"] = raw_model["importSource"]
+        if "attributes" in raw_model:
+            model["attributes"] = raw_model["attributes"].copy()
+        new_state.model.current = model
+        # most elements have no event handlers - skip the call unless there's work
+        handlers_by_event = raw_model.get("eventHandlers")
+        if handlers_by_event or (old_state is not None and old_state.targets_by_event):
+            self._render_model_event_handlers(
+                old_state, new_state, handlers_by_event or {}
+            )
+        # leaf elements are common so avoid creating a coroutine when there's no work
+        if "children" in raw_model or (
+            old_state is not None and old_state.children_by_key
+        ):
+            await self._render_model_children(
+                exit_stack, old_state, new_state, raw_model.get("children", [])
+            )
 
-    def _render_model_attributes(
+    def _render_model_event_handlers(
         self,
         old_state: _ModelState | None,
         new_state: _ModelState,
-        raw_model: dict[str, Any],
+        handlers_by_event: EventHandlerDict,
     ) -> None:
-        # extract event handlers from 'eventHandlers' and 'attributes'
-        handlers_by_event: EventHandlerDict = raw_model.get("eventHandlers", {})
-
-        if "attributes" in raw_model:
-            attrs = raw_model["attributes"].copy()
-            new_state.model.current["attributes"] = attrs
-
         if old_state is None:
             self._render_model_event_handlers_without_old_state(
                 new_state, handlers_by_event
             )
             return None
 
-        for old_event in set(old_state.targets_by_event).difference(handlers_by_event):
-            old_target = old_state.targets_by_event[old_event]
-            del self._event_handlers[old_target]
+        old_targets_by_event = old_state.targets_by_event
+        for old_event in old_targets_by_event.keys() - handlers_by_event.keys():
+            del self._event_handlers[old_targets_by_event[old_event]]
 
         if not handlers_by_event:
             return None
 
         model_event_handlers = new_state.model.current["eventHandlers"] = {}
+        new_targets_by_event = new_state.targets_by_event
+        event_handlers = self._event_handlers
         for event, handler in handlers_by_event.items():
-            if event in old_state.targets_by_event:
-                target = old_state.targets_by_event[event]
+            if event in old_targets_by_event:
+                target = old_targets_by_event[event]
             else:
-                target = uuid4().hex if handler.target is None else handler.target
-            new_state.targets_by_event[event] = target
-            self._event_handlers[target] = handler
+                target = _new_id() if handler.target is None else handler.target
+            new_targets_by_event[event] = target
+            event_handlers[target] = handler
             model_event_handlers[event] = {
                 "target": target,
                 "preventDefault": handler.prevent_default,
@@ -300,10 +312,12 @@ class Layout:
             return None
 
         model_event_handlers = new_state.model.current["eventHandlers"] = {}
+        new_targets_by_event = new_state.targets_by_event
+        event_handlers = self._event_handlers
         for event, handler in handlers_by_event.items():
-            target = uuid4().hex if handler.target is None else handler.target
-            new_state.targets_by_event[event] = target
-            self._event_handlers[target] = handler
+            target = _new_id() if handler.target is None else handler.target
+            new_targets_by_event[event] = target
+            event_handlers[target] = handler
             model_event_handlers[event] = {
                 "target": target,
                 "preventDefault": handler.prevent_default,
@@ -331,6 +345,13 @@ class Layout:
         elif not raw_children:
             await self._unmount_model_states(list(old_state.children_by_key.values()))
             return None
+        elif _is_all_strings(raw_children):
+            if old_state.children_by_key:
+                await self._unmount_model_states(
+                    list(old_state.children_by_key.values())
+                )
+            new_state.model.current["children"] = list(raw_children)
+            return None
 
         children_info = _get_children_info(raw_children)
 
@@ -423,6 +444,10 @@ class Layout:
         new_state: _ModelState,
         raw_children: list[Any],
     ) -> None:
+        if _is_all_strings(raw_children):
+            new_state.model.current["children"] = list(raw_children)
+            return None
+
         children_info = _get_children_info(raw_children)
 
         new_keys = {k for _, _, k in children_info}
@@ -449,33 +474,63 @@ class Layout:
 
     async def _unmount_model_states(self, old_states: list[_ModelState]) -> None:
         to_unmount = old_states[::-1]  # unmount in reversed order of rendering
+        hooks_to_unmount: list[LifeCycleHook] = []
+        event_handlers = self._event_handlers
         while to_unmount:
             model_state = to_unmount.pop()
 
             for target in model_state.targets_by_event.values():
-                del self._event_handlers[target]
+                del event_handlers[target]
 
             if model_state.is_component_state:
                 life_cycle_state = model_state.life_cycle_state
                 del self._model_states_by_life_cycle_state_id[life_cycle_state.id]
-                await life_cycle_state.hook.affect_component_will_unmount()
+                hooks_to_unmount.append(life_cycle_state.hook)
 
             to_unmount.extend(model_state.children_by_key.values())
 
+        # the hooks handle their own errors so it's safe to wait on them all at once
+        if len(hooks_to_unmount) == 1:
+            await hooks_to_unmount[0].affect_component_will_unmount()
+        elif hooks_to_unmount:
+            await gather(*[h.affect_component_will_unmount() for h in hooks_to_unmount])
+
     def _schedule_render_task(self, lcs_id: _LifeCycleStateId) -> None:
         if not REACTPY_ASYNC_RENDERING.current:
             self._rendering_queue.put(lcs_id)
             return None
+        if lcs_id not in self._model_states_by_life_cycle_state_id:
+            logger.debug(
+                "Did not render component with model state ID "
+                f"{lcs_id!r} - component already unmounted"
+            )
+            return None
+        task = create_task(self._create_scheduled_layout_update(lcs_id))
+        self._render_tasks.add(task)
+        task.add_done_callback(self._on_render_task_done)
+
+    async def _create_scheduled_layout_update(
+        self, lcs_id: _LifeCycleStateId
+    ) -> LayoutUpdateMessage | None:
+        # look the state up again since the component may have been unmounted, or
+        # re-rendered by its parent, between scheduling this task and it starting
         try:
             model_state = self._model_states_by_life_cycle_state_id[lcs_id]
         except KeyError:
             logger.debug(
                 "Did not render component with model state ID "
-                f"{lcs_id!r} - component already unmounted"
+                f"{lcs_id!r} - component unmounted before render started"
             )
-        else:
-            self._render_tasks.add(create_task(self._create_layout_update(model_state)))
-            self._render_tasks_ready.release()
+            return None
+        return await self._create_layout_update(model_state)
+
+    def _on_render_task_done(self, task: Task[LayoutUpdateMessage | None]) -> None:
+        self._render_tasks.discard(task)
+        if task.cancelled():
+            return None
+        if task.exception() is None and task.result() is None:
+            return None  # the component unmounted so there's no update to send
+        self._finished_render_tasks.put_nowait(task)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.root})"
@@ -595,9 +650,9 @@ class _ModelState:
     __slots__ = (
         "__weakref__",
         "_parent_ref",
-        "_render_semaphore",
         "children_by_key",
         "index",
+        "is_component_state",
         "key",
         "life_cycle_state",
         "model",
@@ -634,6 +689,9 @@ class _ModelState:
         self.targets_by_event = targets_by_event
         """The element's event handler target strings indexed by their event name"""
 
+        self.is_component_state = life_cycle_state is not None
+        """Whether this state belongs to a component (i.e. has a life cycle state)"""
+
         # === Conditionally Available Attributes ===
         # It's easier to conditionally assign than to force a null check on every usage
 
@@ -645,10 +703,6 @@ class _ModelState:
             self.life_cycle_state = life_cycle_state
             """The state for the element's component (if it has one)"""
 
-    @property
-    def is_component_state(self) -> bool:
-        return hasattr(self, "life_cycle_state")
-
     @property
     def parent(self) -> _ModelState:
         parent = self._parent_ref()
@@ -667,7 +721,7 @@ def _make_life_cycle_state(
     component: ComponentType,
     schedule_render: Callable[[_LifeCycleStateId], None],
 ) -> _LifeCycleState:
-    life_cycle_state_id = _LifeCycleStateId(uuid4().hex)
+    life_cycle_state_id = _LifeCycleStateId(_new_id())
     return _LifeCycleState(
         life_cycle_state_id,
         LifeCycleHook(lambda: schedule_render(life_cycle_state_id)),
@@ -687,6 +741,15 @@ def _update_life_cycle_state(
     )
 
 
+def _new_id() -> str:
+    # as unique as uuid4().hex but without reading from os.urandom every time
+    return f"{_ID_RANDOM.getrandbits(128):032x}"
+
+
+# a private generator since user code may seed the global one (e.g. random.seed(0))
+_ID_RANDOM = Random()
+
+
 _LifeCycleStateId = NewType("_LifeCycleStateId", str)
 
 
@@ -728,15 +791,24 @@ def _get_children_info(children: list[VdomChild]) -> Sequence[_ChildInfo]:
     for index, child in enumerate(children):
         if child is None:
             continue
-        elif isinstance(child, dict):
-            child_type = _DICT_TYPE
-            key = child.get("key")
-        elif isinstance(child, ComponentType):
-            child_type = _COMPONENT_TYPE
-            key = child.key
+
+        # most children are exactly one of these types so we can skip the isinstance
+        # checks (the one against the runtime ComponentType protocol is especially slow)
+        child_type = _ELEMENT_TYPE_BY_PYTHON_TYPE.get(type(child))
+        if child_type is None:
+            if isinstance(child, dict):
+                child_type = _DICT_TYPE
+            elif isinstance(child, ComponentType):
+                child_type = _COMPONENT_TYPE
+            else:
+                child_type = _STRING_TYPE
+
+        if child_type is _DICT_TYPE:
+            key = cast(dict[str, Any], child).get("key")
+        elif child_type is _COMPONENT_TYPE:
+            key = cast(ComponentType, child).key
         else:
             child = f"{child}"
-            child_type = _STRING_TYPE
             key = None
 
         if key is None:
@@ -747,6 +819,11 @@ def _get_children_info(children: list[VdomChild]) -> Sequence[_ChildInfo]:
     return infos
 
 
+def _is_all_strings(children: Sequence[Any]) -> bool:
+    # text-only children are common and need no keys or model states
+    return all(type(child) is str for child in children)
+
+
 _ChildInfo: TypeAlias = tuple[Any, "_ElementType", Key]
 
 # used in _process_child_type_and_key
@@ -754,3 +831,10 @@ _ElementType = NewType("_ElementType", int)
 _DICT_TYPE = _ElementType(1)
 _COMPONENT_TYPE = _ElementType(2)
 _STRING_TYPE = _ElementType(3)
+_ELEMENT_TYPE_BY_PYTHON_TYPE: dict[type[Any], _ElementType] = {
+    dict: _DICT_TYPE,
+    Component: _COMPONENT_TYPE,
+    str: _STRING_TYPE,
+    int: _STRING_TYPE,
+    float: _STRING_TYPE,
+}
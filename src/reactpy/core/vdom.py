@@ -94,6 +94,10 @@ VDOM_JSON_SCHEMA = {
 # we can't add a docstring to this because Sphinx doesn't know how to find its source
 _COMPILED_VDOM_VALIDATOR = compile_json_schema(VDOM_JSON_SCHEMA)
 
+# the common concrete types of children - used to skip slower isinstance checks
+_SINGLE_CHILD_TYPES = frozenset((str, dict))
+_CHILD_LIST_TYPES = frozenset((list, tuple))
+
 
 def validate_vdom_json(value: Any) -> VdomJson:
     """Validate serialized VDOM - see :attr:`VDOM_JSON_SCHEMA` for more info"""
@@ -304,15 +308,23 @@ def separate_attributes_and_event_handlers(
 
         separated_event_handlers[k] = handler
 
-    return separated_attributes, dict(separated_event_handlers.items())
+    return separated_attributes, separated_event_handlers
 
 
 def _is_attributes(value: Any) -> bool:
-    return isinstance(value, Mapping) and "tagName" not in value
+    # check the concrete type first - isinstance against the Mapping ABC is slow
+    return (
+        type(value) is dict or isinstance(value, Mapping)
+    ) and "tagName" not in value
 
 
 def _is_single_child(value: Any) -> bool:
-    if isinstance(value, (str, Mapping)) or not hasattr(value, "__iter__"):
+    value_type = type(value)
+    if value_type in _SINGLE_CHILD_TYPES:
+        return True
+    if value_type not in _CHILD_LIST_TYPES and (
+        isinstance(value, (str, Mapping)) or not hasattr(value, "__iter__")
+    ):
         return True
     if REACTPY_DEBUG_MODE.current:
         _validate_child_key_integrity(value)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import os
 import shutil
 import time
 from collections.abc import Awaitable
@@ -19,8 +20,13 @@ from reactpy.core.events import EventHandler, to_event_handler_function
 
 def clear_reactpy_web_modules_dir() -> None:
     """Clear the directory where ReactPy stores registered web modules"""
-    for path in REACTPY_WEB_MODULES_DIR.current.iterdir():
-        shutil.rmtree(path) if path.is_dir() else path.unlink()
+    # scandir entries know their type so this avoids a stat call per path
+    with os.scandir(REACTPY_WEB_MODULES_DIR.current) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
 
 
 _P = ParamSpec("_P")
@@ -226,9 +226,8 @@ def module_from_file(
 def _equal_files(f1: Path, f2: Path) -> bool:
     f1 = f1.resolve()
     f2 = f2.resolve()
-    return (
-        (f1.is_symlink() or f2.is_symlink()) and (f1.resolve() == f2.resolve())
-    ) or filecmp.cmp(str(f1), str(f2), shallow=False)
+    # resolved paths are the same if one is a symlink to the other
+    return f1 == f2 or filecmp.cmp(str(f1), str(f2), shallow=False)
 
 
 def _copy_file(target: Path, source: Path, symlink: bool) -> None:
@@ -269,16 +268,19 @@ def module_from_string(
     name += module_name_suffix(name)
 
     target_file = _web_module_path(name)
+    # compare and write encoded bytes so an unchanged module is never decoded or rewritten
+    data = content.encode("utf-8")
 
-    if target_file.exists() and target_file.read_text(encoding="utf-8") != content:
+    if not target_file.exists():
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.write_bytes(data)
+    elif target_file.read_bytes() != data:
         logger.info(
             f"Existing web module {name!r} will "
             f"be replaced with {target_file.resolve()}"
         )
         target_file.unlink()
-
-    target_file.parent.mkdir(parents=True, exist_ok=True)
-    target_file.write_text(content)
+        target_file.write_bytes(data)
 
     return WebModule(
         source=name,
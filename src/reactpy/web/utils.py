@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
 from urllib.parse import urlparse, urlunparse
 
@@ -20,59 +23,123 @@ def resolve_module_exports_from_file(
     file: Path,
     max_depth: int,
     is_re_export: bool = False,
+) -> set[str]:
+    return _resolve_module_exports_from_file(file, max_depth, is_re_export, {})
+
+
+def resolve_module_exports_from_url(
+    url: str,
+    max_depth: int,
+    is_re_export: bool = False,
+) -> set[str]:
+    return _resolve_module_exports_from_url(url, max_depth, is_re_export, {})
+
+
+def _resolve_module_exports_from_file(
+    file: Path,
+    max_depth: int,
+    is_re_export: bool,
+    sources: dict[str, str | None],
 ) -> set[str]:
     if max_depth == 0:
         logger.warning(f"Did not resolve all exports for {file} - max depth reached")
         return set()
-    elif not file.exists():
-        logger.warning(f"Did not resolve exports for unknown file {file}")
+
+    # the same module is often referenced from several places in one export graph
+    key = str(file.resolve())
+    if key not in sources:
+        sources[key] = _read_file_source(file)
+    source = sources[key]
+    if source is None:
         return set()
 
     export_names, references = resolve_module_exports_from_source(
-        file.read_text(encoding="utf-8"), exclude_default=is_re_export
+        source, exclude_default=is_re_export
     )
 
     for ref in references:
         if urlparse(ref).scheme:  # is an absolute URL
             export_names.update(
-                resolve_module_exports_from_url(ref, max_depth - 1, is_re_export=True)
+                _resolve_module_exports_from_url(ref, max_depth - 1, True, sources)
             )
         else:
             path = file.parent.joinpath(*ref.split("/"))
             export_names.update(
-                resolve_module_exports_from_file(path, max_depth - 1, is_re_export=True)
+                _resolve_module_exports_from_file(path, max_depth - 1, True, sources)
             )
 
     return export_names
 
 
-def resolve_module_exports_from_url(
+def _resolve_module_exports_from_url(
     url: str,
     max_depth: int,
-    is_re_export: bool = False,
+    is_re_export: bool,
+    sources: dict[str, str | None],
 ) -> set[str]:
-    if max_depth == 0:
-        logger.warning(f"Did not resolve all exports for {url} - max depth reached")
-        return set()
+    export_names: set[str] = set()
+
+    # Resolve the export graph one layer at a time. Fetching is network bound so
+    # each layer is fetched concurrently, but only this thread submits work to the
+    # pool - recursively submitting into a bounded pool could deadlock.
+    layer = [url]
+    seen = {url}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while layer:
+            if max_depth == 0:
+                for layer_url in layer:
+                    logger.warning(
+                        f"Did not resolve all exports for {layer_url} "
+                        "- max depth reached"
+                    )
+                break
+
+            # the same module is often referenced from several places in one graph
+            to_fetch = [u for u in layer if u not in sources]
+            if len(to_fetch) > 1:
+                fetched = executor.map(_fetch_url_source, to_fetch)
+            else:
+                fetched = map(_fetch_url_source, to_fetch)
+            sources.update(zip(to_fetch, fetched))
+
+            next_layer: list[str] = []
+            for layer_url in layer:
+                text = sources[layer_url]
+                if text is None:
+                    continue
+                names, references = resolve_module_exports_from_source(
+                    text, exclude_default=is_re_export
+                )
+                export_names.update(names)
+                for ref in references:
+                    ref_url = _resolve_relative_url(layer_url, ref)
+                    if ref_url not in seen:
+                        seen.add(ref_url)
+                        next_layer.append(ref_url)
+
+            layer = next_layer
+            max_depth -= 1
+            is_re_export = True
+
+    return export_names
+
+
+def _read_file_source(file: Path) -> str | None:
+    try:
+        # no separate exists() check - reading the file tells us the same thing
+        return file.read_text(encoding="utf-8")
+    except OSError:  # e.g. missing, a path segment that isn't a dir, or a symlink loop
+        logger.warning(f"Did not resolve exports for unknown file {file}")
+        return None
+
 
+def _fetch_url_source(url: str) -> str | None:
     try:
-        text = requests.get(url, timeout=5).text
+        return requests.get(url, timeout=5).text
     except requests.exceptions.ConnectionError as error:
         reason = "" if error is None else " - {error.errno}"
         logger.warning("Did not resolve exports for url " + url + reason)
-        return set()
-
-    export_names, references = resolve_module_exports_from_source(
-        text, exclude_default=is_re_export
-    )
-
-    for ref in references:
-        url = _resolve_relative_url(url, ref)
-        export_names.update(
-            resolve_module_exports_from_url(url, max_depth - 1, is_re_export=True)
-        )
-
-    return export_names
+        return None
 
 
 def resolve_module_exports_from_source(
@@ -148,11 +215,13 @@ def _resolve_relative_url(base_url: str, rel_url: str) -> str:
     return f"{base_url}/{rel_url}"
 
 
+# these are only ever searched (not matched) so they don't need a leading ';?\s*' -
+# that optional prefix made the regex engine retry at every run of whitespace
 _JS_DEFAULT_EXPORT_PATTERN = re.compile(
-    r";?\s*export\s+default\s",
+    r"export\s+default\s",
 )
 _JS_FUNC_OR_CLS_EXPORT_PATTERN = re.compile(
-    r";?\s*export\s+(?:function|class)\s+([a-zA-Z_$][0-9a-zA-Z_$]*)"
+    r"export\s+(?:function|class)\s+([a-zA-Z_$][0-9a-zA-Z_$]*)"
 )
 _JS_GENERAL_EXPORT_PATTERN = re.compile(
     r"(?:^|;|})\s*export(?=\s+|{)(.*?)(?=;|$)", re.MULTILINE
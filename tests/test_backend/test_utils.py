@@ -1,12 +1,15 @@
+import asyncio
+import sys
 import threading
 import time
 from contextlib import ExitStack
+from types import ModuleType
 
 import pytest
 from playwright.async_api import Page
 
 from reactpy.backend import flask as flask_implementation
-from reactpy.backend.utils import find_available_port
+from reactpy.backend.utils import _run_coroutine, find_available_port
 from reactpy.backend.utils import run as sync_run
 from tests.sample import SampleApp
 
@@ -19,11 +22,63 @@ def exit_stack():
 
 def test_find_available_port():
     assert find_available_port("localhost", port_min=5000, port_max=6000)
-    with pytest.raises(RuntimeError, match="no available port"):
+    with pytest.raises(RuntimeError, match="no available port in range 0-0"):
         # check that if port range is exhausted we raise
         find_available_port("localhost", port_min=0, port_max=0)
 
 
+def test_run_coroutine_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # makes the import fail
+
+    loops = []
+
+    async def main():
+        loops.append(asyncio.get_running_loop())
+
+    _run_coroutine(main())
+
+    assert len(loops) == 1
+    assert loops[0].is_closed()
+
+
+def test_run_coroutine_with_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+
+    loops = []
+
+    async def main():
+        loops.append(asyncio.get_running_loop())
+
+    _run_coroutine(main())
+
+    assert len(loops) == 1
+    assert isinstance(loops[0], uvloop.Loop)
+
+
+def test_run_coroutine_with_uvloop_before_run_function_was_added(monkeypatch):
+    created_loops = []
+
+    def new_event_loop():
+        loop = asyncio.new_event_loop()
+        created_loops.append(loop)
+        return loop
+
+    # uvloop<0.18 only had new_event_loop() and no run() function
+    old_uvloop = ModuleType("uvloop")
+    old_uvloop.new_event_loop = new_event_loop
+    monkeypatch.setitem(sys.modules, "uvloop", old_uvloop)
+
+    running_loops = []
+
+    async def main():
+        running_loops.append(asyncio.get_running_loop())
+
+    _run_coroutine(main())
+
+    assert running_loops == created_loops
+    assert created_loops[0].is_closed()
+
+
 async def test_run(page: Page):
     host = "127.0.0.1"
     port = find_available_port(host)
@@ -996,6 +996,33 @@ async def test_context_values_are_scoped():
         await layout.render()
 
 
+async def test_context_values_do_not_leak_into_renders_scheduled_during_render():
+    Context = reactpy.create_context("default")
+    set_other_state = Ref()
+    context_values = []
+
+    @reactpy.component
+    def Parent():
+        return html.div(Other(), Context(SetsOtherState(), value="provided"))
+
+    @reactpy.component
+    def SetsOtherState():
+        set_other_state.current(1)
+        return html.div()
+
+    @reactpy.component
+    def Other():
+        _, set_other_state.current = reactpy.use_state(0)
+        context_values.append(reactpy.use_context(Context))
+        return html.div()
+
+    async with Layout(Parent()) as layout:
+        await layout.render()
+        await layout.render()
+
+    assert context_values == ["default", "default"]
+
+
 async def test_error_in_layout_effect_cleanup_is_gracefully_handled():
     component_hook = HookCatcher()
 
@@ -1194,6 +1221,18 @@ def test_strictly_equal_named_closures():
     assert strictly_equal(generator(), generator()) is True
 
 
+def test_strictly_equal_identical_objects():
+    class NeverEqual:
+        def __eq__(self, other):
+            return False
+
+        __hash__ = object.__hash__
+
+    value = NeverEqual()
+    assert strictly_equal(value, value) is True
+    assert strictly_equal(value, NeverEqual()) is False
+
+
 STRICT_EQUALITY_VALUE_CONSTRUCTORS = [
     lambda: "string-text",
     lambda: b"byte-text",
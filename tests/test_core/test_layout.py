@@ -905,6 +905,23 @@ async def test_changing_key_of_parent_element_unmounts_children():
             assert last_state != state.current
 
 
+async def test_seeding_global_random_does_not_cause_id_collisions():
+    @reactpy.component
+    def Root():
+        return html.div(SeedsRandom(key="a"), SeedsRandom(key="b"))
+
+    @reactpy.component
+    def SeedsRandom():
+        random.seed(0)
+        return html.button({"on_click": lambda event: None})
+
+    async with reactpy.Layout(Root()) as layout:
+        await layout.render()
+        # two buttons each with their own handler - none overwritten by the other
+        assert len(layout._event_handlers) == 2
+        assert len(layout._model_states_by_life_cycle_state_id) == 3
+
+
 async def test_switching_node_type_with_event_handlers():
     toggle_type = reactpy.Ref()
     element_static_handler = StaticEventHandler()
@@ -1341,3 +1358,63 @@ async def test_conditionally_render_none_does_not_trigger_state_change_in_siblin
         toggle_condition.current()
         await runner.render()
     assert effect_run_count.current == 1
+
+
+async def test_render_of_component_unmounted_before_it_started_is_dropped(
+    async_rendering,
+):
+    if not async_rendering:
+        raise pytest.skip("Async rendering not enabled")
+
+    child_hook = HookCatcher()
+    toggle_child = Ref()
+    child_render_count = Ref(0)
+
+    @component
+    def Root():
+        show_child, toggle_child.current = use_toggle(True)
+        if not show_child:
+            # the child is unmounted below before this render task can start
+            child_hook.latest.schedule_render()
+            return html.div()
+        return html.div(Child())
+
+    @component
+    @child_hook.capture
+    def Child():
+        child_render_count.current += 1
+        return html.span()
+
+    async with Layout(Root()) as layout:
+        await layout.render()
+        assert child_render_count.current == 1
+
+        with assert_reactpy_did_log(r"unmounted before render started"):
+            toggle_child.current()
+            assert await layout.render() == update_message(
+                path="",
+                model={"tagName": "", "children": [{"tagName": "div"}]},
+            )
+            if layout._render_tasks:
+                await asyncio.wait(list(layout._render_tasks))
+
+        # the child's render produced no update and never actually ran
+        assert layout._finished_render_tasks.empty()
+        assert child_render_count.current == 1
+
+        toggle_child.current()
+        assert await layout.render() == update_message(
+            path="",
+            model={
+                "tagName": "",
+                "children": [
+                    {
+                        "tagName": "div",
+                        "children": [
+                            {"tagName": "", "children": [{"tagName": "span"}]}
+                        ],
+                    }
+                ],
+            },
+        )
+        assert child_render_count.current == 2
@@ -5,6 +5,7 @@ import pytest
 
 from reactpy import Ref, component, html, testing
 from reactpy.backend import starlette as starlette_implementation
+from reactpy.config import REACTPY_WEB_MODULES_DIR
 from reactpy.logging import ROOT_LOGGER
 from reactpy.testing.backend import _hotswap
 from reactpy.testing.display import DisplayFixture
@@ -173,6 +174,25 @@ def test_list_logged_excptions():
         assert logged_errors == [the_error]
 
 
+def test_clear_reactpy_web_modules_dir(tmp_path, monkeypatch):
+    modules_dir = tmp_path / "web_modules"
+    modules_dir.mkdir()
+    (modules_dir / "some-module.js").write_text("")
+    (modules_dir / "some-dir").mkdir()
+    (modules_dir / "some-dir" / "nested-module.js").write_text("")
+    outside_dir = tmp_path / "outside"
+    outside_dir.mkdir()
+    (outside_dir / "keep-me.js").write_text("")
+    (modules_dir / "linked-dir").symlink_to(outside_dir, target_is_directory=True)
+
+    monkeypatch.setattr(REACTPY_WEB_MODULES_DIR, "current", modules_dir)
+    testing.clear_reactpy_web_modules_dir()
+
+    assert list(modules_dir.iterdir()) == []
+    # only the link is removed - not what it points to
+    assert (outside_dir / "keep-me.js").exists()
+
+
 async def test_hotswap_update_on_change(display: DisplayFixture):
     """Ensure shared hotswapping works
 
@@ -219,3 +219,5 @@ def test_module_from_string():
     reactpy.web.module_from_string("temp", "old")
     with assert_reactpy_did_log(r"Existing web module .* will be replaced with"):
         reactpy.web.module_from_string("temp", "new")
+    with assert_reactpy_did_not_log(r"Existing web module .* will be replaced with"):
+        reactpy.web.module_from_string("temp", "new")
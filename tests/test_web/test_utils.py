@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 import pytest
@@ -72,6 +73,16 @@ def test_resolve_module_exports_from_file_log_on_unknown_file_location(
     )
 
 
+def test_resolve_module_exports_from_file_log_on_path_through_a_file(caplog, tmp_path):
+    file = tmp_path / "some.js"
+    file.write_text("export * from './some.js/nested.js';")
+    assert resolve_module_exports_from_file(file, 2) == set()
+    assert len(caplog.records) == 1
+    assert caplog.records[0].message.startswith(
+        "Did not resolve exports for unknown file"
+    )
+
+
 @responses.activate
 def test_resolve_module_exports_from_url():
     responses.add(
@@ -103,6 +114,102 @@ def test_resolve_module_exports_from_url():
     }
 
 
+@responses.activate
+def test_resolve_module_exports_from_url_with_many_references():
+    responses.add(
+        responses.GET,
+        "https://some.url/path/index.js",
+        body=(
+            "export * from './first.js'; "
+            "export * from './second.js'; "
+            "export * from '../third.js';"
+        ),
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/path/first.js",
+        body="export const First = 1;",
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/path/second.js",
+        body="export const Second = 2;",
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/third.js",
+        body="export const Third = 3;",
+    )
+
+    assert resolve_module_exports_from_url("https://some.url/path/index.js", 2) == {
+        "First",
+        "Second",
+        "Third",
+    }
+
+
+@responses.activate
+def test_resolve_module_exports_from_url_fetches_shared_reference_once():
+    responses.add(
+        responses.GET,
+        "https://some.url/index.js",
+        body="export * from './first.js'; export * from './second.js';",
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/first.js",
+        body="export const First = 1; export * from './shared.js';",
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/second.js",
+        body="export const Second = 2; export * from './shared.js';",
+    )
+    responses.add(
+        responses.GET,
+        "https://some.url/shared.js",
+        body="export const Shared = 3;",
+    )
+
+    assert resolve_module_exports_from_url("https://some.url/index.js", 3) == {
+        "First",
+        "Second",
+        "Shared",
+    }
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_resolve_module_exports_from_url_uses_a_bounded_number_of_threads():
+    fetching_threads = set()
+
+    def add_module(path, body):
+        def callback(request):
+            fetching_threads.add(threading.current_thread().name)
+            return 200, {}, body
+
+        responses.add_callback(responses.GET, f"https://some.url/{path}", callback)
+
+    expected_names = set()
+    add_module(
+        "index.js", "; ".join(f"export * from './{i}/index.js'" for i in range(6))
+    )
+    for i in range(6):
+        add_module(
+            f"{i}/index.js",
+            "; ".join(f"export * from './{j}.js'" for j in range(6)),
+        )
+        for j in range(6):
+            add_module(f"{i}/{j}.js", f"export const Name{i}{j} = 1;")
+            expected_names.add(f"Name{i}{j}")
+
+    assert resolve_module_exports_from_url("https://some.url/index.js", 3) == (
+        expected_names
+    )
+    # one pool of up to 8 workers plus the calling thread for the root module
+    assert len(fetching_threads) <= 9
+
+
 def test_resolve_module_exports_from_url_log_on_max_depth(caplog):
     assert resolve_module_exports_from_url("https://some.url", 0) == set()
     assert len(caplog.records) == 1